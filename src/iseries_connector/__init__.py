@@ -3,6 +3,7 @@
 from .iseries_connector import ISeriesConn, ISeriesConfig, load_env
 from .data_transfer import DataTransferConfig, DataTransferManager, DataTransferResult
 from .exceptions import ISeriesConnectorError, ConnectionError, QueryError, ValidationError
+from .utils import RequestIdFilter, setup_logging
 
 __version__ = '0.2.0'
 __author__ = 'Jared Felice'
@@ -19,4 +20,6 @@ __all__ = [
     'DataTransferResult',
     'DataTransferManager',
     'ValidationError',
+    'RequestIdFilter',
+    'setup_logging',
 ]
@@ -27,19 +27,28 @@ Example:
     
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+import functools
+import hashlib
 import os
+import re
 import subprocess
-import time
+import sys
 import logging
-from typing import Dict, List, Optional, Any, Generator, Union
+from typing import Callable, ClassVar, Dict, List, Optional, Any, Generator, Tuple, Union
 from pathlib import Path
 import importlib.resources
 import tempfile
 import json
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 from .exceptions import (
     ISeriesConnectorError,
     ConfigurationError,
@@ -51,6 +60,83 @@ from .iseries_connector import load_env
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# Precompiled pattern for extracting the transferred row count from ACS output
+_ROW_COUNT_RE = re.compile(r'rows transferred:\s*(\d+)', re.IGNORECASE)
+
+# Pattern for the {{key}} placeholders in DTFX templates
+_PLACEHOLDER_RE = re.compile(r'\{\{(\w+)\}\}')
+
+
+@functools.lru_cache(maxsize=256)
+def _path_exists_cached(path: str) -> bool:
+    """Check whether a path exists, caching the result per path.
+
+    Configuration validation repeatedly stats the same launcher and
+    template paths; caching turns those syscalls into dict lookups.
+    Call ``_path_exists_cached.cache_clear()`` if a checked path is
+    created or removed at runtime.
+
+    Args:
+        path (str): Path to check
+
+    Returns:
+        bool: True if the path exists
+    """
+    return os.path.exists(path)
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_output_path(directory: str, schema: str, table: str, suffix: str) -> str:
+    """Join an output directory with a ``<schema>_<table><suffix>`` filename.
+
+    Transfers for the same table are keyed on the same arguments across
+    batches and retries, so the joined path string is cached rather than
+    rebuilt per call.
+
+    Args:
+        directory (str): Directory the file lives in
+        schema (str): Source schema name
+        table (str): Source table name
+        suffix (str): File suffix including the dot (e.g. '.csv')
+
+    Returns:
+        str: The joined path
+    """
+    return os.path.join(directory, f"{schema}_{table}{suffix}")
+
+
+def _compile_template(content: str) -> Callable[[Dict[str, str]], str]:
+    """Compile a DTFX template into a specialized render function.
+
+    The template is split on its ``{{key}}`` placeholders once, so each
+    render is a single ``str.join`` over precomputed literal fragments and
+    looked-up values — no placeholder parsing at call time. Placeholders
+    with no entry in the value mapping are re-emitted verbatim, matching
+    ``string.Template.safe_substitute`` so custom templates may carry
+    placeholders this library doesn't know about.
+
+    Args:
+        content: The raw template content
+
+    Returns:
+        Callable that renders the template from a placeholder mapping
+    """
+    parts = _PLACEHOLDER_RE.split(content)
+    literals = parts[0::2]
+    names = parts[1::2]
+
+    def render(values: Dict[str, str]) -> str:
+        pieces: List[str] = []
+        for literal, name in zip(literals, names):
+            pieces.append(literal)
+            value = values.get(name)
+            # Unknown placeholder: keep it verbatim (safe-substitute)
+            pieces.append(f"{{{{{name}}}}}" if value is None else value)
+        pieces.append(literals[-1])
+        return ''.join(pieces)
+
+    return render
+
 @dataclass
 class DataTransferConfig:
     """Configuration for data transfer operations.
@@ -89,20 +175,31 @@ class DataTransferConfig:
     local_raw_data_directory: Optional[str] = None
     local_data_package_directory: Optional[str] = None
 
+    # Cached from_env result, used when ISERIES_CACHE_ENV=1
+    _env_cache: ClassVar[Optional['DataTransferConfig']] = None
+
     @classmethod
     def from_env(cls) -> 'DataTransferConfig':
         """Create a configuration from environment variables.
-        
+
+        When ``ISERIES_CACHE_ENV=1`` is set, the parsed configuration is
+        cached and reused on subsequent calls, skipping the re-parsing of
+        environment variables. Use :meth:`invalidate_env_cache` after
+        changing the environment at runtime.
+
         Returns:
             DataTransferConfig: A new configuration instance
-            
+
         Raises:
             ValueError: If required environment variables are missing
         """
+        use_cache = os.environ.get('ISERIES_CACHE_ENV') == '1'
+        if use_cache and cls._env_cache is not None:
+            return cls._env_cache
         # Load environment variables from a .env file (if present),
         # without overwriting any existing environment variables.
         load_env()
-        return cls(
+        config = cls(
             host_name=os.environ.get('ISERIES_HOST_NAME', ''),
             database=os.environ.get('ISERIES_DATABASE', '*SYSBAS'),
             acs_launcher_path=os.environ.get(
@@ -114,6 +211,14 @@ class DataTransferConfig:
             local_raw_data_directory=os.environ.get('ISERIES_RAW_DATA_DIR'),
             local_data_package_directory=os.environ.get('ISERIES_DATA_PACKAGE_DIR')
         )
+        if use_cache:
+            cls._env_cache = config
+        return config
+
+    @classmethod
+    def invalidate_env_cache(cls) -> None:
+        """Discard the configuration cached by ``from_env``."""
+        cls._env_cache = None
 
     def validate(self) -> None:
         """Validate the configuration parameters.
@@ -122,15 +227,15 @@ class DataTransferConfig:
             ValidationError: If any required parameters are missing or invalid
         """
         if not self.host_name:
-            raise ValidationError("Host name is required")
+            raise ValidationError.missing_field("Host name")
         
-        if not os.path.exists(self.acs_launcher_path):
+        if not _path_exists_cached(self.acs_launcher_path):
             raise ValidationError(f"ACS Launcher not found at: {self.acs_launcher_path}")
         
         if self.batch_size <= 0:
             raise ValidationError("Batch size must be a positive number")
         
-        if self.template_path and not os.path.exists(self.template_path):
+        if self.template_path and not _path_exists_cached(self.template_path):
             raise ValidationError(f"Template file not found: {self.template_path}")
         
         # Set default paths if not provided
@@ -205,9 +310,34 @@ class DataTransferResult:
         """
         return self.success
 
+    def to_dict_fast(self) -> Dict[str, Any]:
+        """Convert the result to a dictionary, keeping datetime objects as-is.
+
+        Unlike ``to_dict``, this skips the ``isoformat()`` string conversions,
+        which is useful for serializers (such as ``orjson``) that handle
+        ``datetime`` natively.
+
+        Returns:
+            Dict[str, Any]: Dictionary representation with raw datetime values
+        """
+        return {
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'duration': self.duration,
+            'row_count': self.row_count,
+            'success': self.success,
+            'error': self.error,
+            'file_path': self.file_path,
+            'source_schema': self.source_schema,
+            'source_table': self.source_table,
+            'batch_start_time': self.batch_start_time,
+            'batch_end_time': self.batch_end_time,
+            'batch_duration': self.batch_duration
+        }
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert the result to a dictionary.
-        
+
         Returns:
             Dict[str, Any]: Dictionary representation of the result
         """
@@ -275,6 +405,12 @@ class DataTransferResult:
         Returns:
             str: JSON string representation of the result
         """
+        if orjson is not None and indent == 2:
+            # orjson serializes datetime natively, so the isoformat()
+            # conversions in to_dict can be skipped entirely.
+            return orjson.dumps(
+                self.to_dict_fast(), option=orjson.OPT_INDENT_2
+            ).decode('utf-8')
         return json.dumps(self.to_dict(), indent=indent)
 
     def __eq__(self, other: Any) -> bool:
@@ -353,7 +489,11 @@ class DataTransferManager:
             output_directory="C:/custom/output/path"
         ))
     """
-    
+
+    # Template content shared across manager instances, keyed on the
+    # template path ('<builtin>' for the packaged template) and its mtime
+    _TEMPLATE_CLASS_CACHE: Dict[Tuple[str, float], str] = {}
+
     def __init__(
         self,
         host_name: Optional[str] = None,
@@ -412,6 +552,15 @@ class DataTransferManager:
                 local_raw_data_directory=local_raw_data_directory,
                 local_data_package_directory=local_data_package_directory,
             )
+        self._template_cache: Optional[str] = None
+        self._template_cache_key: Optional[Tuple[str, float]] = None
+        self._template_renderer: Optional[Callable[[Dict[str, str]], str]] = None
+        self._ensured_dirs: set = set()
+        self._dtfx_cache: Dict[bytes, str] = {}
+        # Precomputed base paths used by the per-transfer path construction
+        self._dtfx_dir = Path(self.config.local_data_package_directory)
+        self._dtfx_str = os.fspath(self._dtfx_dir)
+        self._raw_dir = Path(self.config.local_raw_data_directory)
         self._validate_config()
     
     def _validate_config(self) -> None:
@@ -421,33 +570,157 @@ class DataTransferManager:
             ConfigurationError: If the configuration is invalid
         """
         try:
-            if self.config.template_path and not os.path.exists(self.config.template_path):
+            if self.config.template_path and not _path_exists_cached(self.config.template_path):
                 raise ConfigurationError(f"Template file not found: {self.config.template_path}")
         except Exception as e:
             logger.error(f"Configuration validation failed: {str(e)}")
             raise
 
+    def _validate_transfer_inputs(
+        self,
+        source_schema: str,
+        source_table: str,
+        sql_statement: str,
+        dtfx_path: str
+    ) -> None:
+        """Validate a single transfer's inputs before any process is spawned.
+
+        Catching obviously bad rows here is far cheaper than paying the ACS
+        startup cost only to have the transfer fail seconds later.
+
+        Args:
+            source_schema: Source schema name
+            source_table: Source table name
+            sql_statement: SQL statement to execute
+            dtfx_path: Path where the DTFX file will be written
+
+        Raises:
+            ValidationError: If any input is empty, the SQL is not a query
+                (SELECT or a WITH-prefixed CTE), or the DTFX path exceeds
+                the Windows path limit
+        """
+        if not source_schema or not source_schema.strip():
+            raise ValidationError("source_schema cannot be empty")
+        if not source_table or not source_table.strip():
+            raise ValidationError("source_table cannot be empty")
+        if not sql_statement or not sql_statement.strip():
+            raise ValidationError(
+                f"sql_statement cannot be empty for {source_schema}.{source_table}"
+            )
+        if not sql_statement.strip().lower().startswith(('select', 'with')):
+            raise ValidationError(
+                f"sql_statement for {source_schema}.{source_table} must be a SELECT statement"
+            )
+        if os.name == 'nt' and len(dtfx_path) >= 259:
+            raise ValidationError(
+                f"DTFX path exceeds the Windows path limit: {dtfx_path}"
+            )
+
+    def _ensure_directory(self, path: str) -> None:
+        """Create a directory if it hasn't already been created by this manager.
+
+        Directories are remembered in a per-instance set so repeated
+        transfers to the same location skip the makedirs syscall.
+
+        Args:
+            path: The directory to create
+        """
+        if path not in self._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._ensured_dirs.add(path)
+
     def _get_template_content(self) -> str:
         """Get the template content from either the configured path or the built-in template.
-        
+
+        The content is cached on the instance after the first read, so batch
+        transfers only pay for a single disk read, and shared across
+        instances through a class-level cache so one manager per host still
+        reads each template once per process. Custom templates are keyed on
+        path and mtime, so repeated calls cost one ``stat()`` instead of a
+        full read and an edited template file is picked up automatically;
+        a template change also invalidates the DTFX reuse cache, so files
+        rendered from the old template are rewritten. The instance cache is
+        likewise invalidated if ``config.template_path`` changes.
+
         Returns:
             str: The template content
-            
+
         Raises:
             ConfigurationError: If there's an error reading the template
         """
         try:
             if self.config.template_path:
-                with open(self.config.template_path, 'r') as file:
-                    return file.read()
+                mtime = os.path.getmtime(self.config.template_path)
+            else:
+                # Package data doesn't change at runtime
+                mtime = 0.0
+        except OSError as e:
+            logger.error(f"Failed to load template: {str(e)}")
+            raise ConfigurationError(f"Error reading template: {str(e)}")
+
+        cache_key = (self.config.template_path or '<builtin>', mtime)
+        if (
+            self._template_cache is not None
+            and self._template_cache_key == cache_key
+        ):
+            return self._template_cache
+
+        if cache_key in self._TEMPLATE_CLASS_CACHE:
+            content = self._TEMPLATE_CLASS_CACHE[cache_key]
+            self._install_template(cache_key, content)
+            return content
+
+        try:
+            if self.config.template_path:
+                content = Path(self.config.template_path).read_text()
             else:
                 # Use the built-in template
-                with importlib.resources.open_text('iseries_connector.templates', 'dtfx_template.txt') as file:
-                    return file.read()
+                content = importlib.resources.files(
+                    'iseries_connector.templates'
+                ).joinpath('dtfx_template.txt').read_text()
         except Exception as e:
             logger.error(f"Failed to load template: {str(e)}")
             raise ConfigurationError(f"Error reading template: {str(e)}")
 
+        self._TEMPLATE_CLASS_CACHE[cache_key] = content
+        self._install_template(cache_key, content)
+        return content
+
+    def _install_template(self, cache_key: Tuple[str, float], content: str) -> None:
+        """Install new template content and invalidate caches derived from the old one.
+
+        Args:
+            cache_key: The (path, mtime) key identifying the template version
+            content: The template content for that key
+        """
+        if self._template_cache_key != cache_key:
+            # Existing DTFX files were rendered from the previous template
+            # version; without this, _create_dtfx_file would silently reuse
+            # them for already-seen host/schema/table/sql combinations.
+            self._dtfx_cache.clear()
+        self._template_cache = content
+        self._template_cache_key = cache_key
+        self._template_renderer = None
+
+    def _get_template_renderer(self) -> Callable[[Dict[str, str]], str]:
+        """Get the render function specialized to the current template.
+
+        The template is parsed into literal fragments once at load time (see
+        :func:`_compile_template`), so each DTFX file is rendered with a
+        single join over the fragments rather than any call-time placeholder
+        parsing.
+
+        Returns:
+            Callable that renders the template from a placeholder mapping
+
+        Raises:
+            ConfigurationError: If there's an error reading the template
+        """
+        content = self._get_template_content()
+        if self._template_renderer is None:
+            self._template_renderer = _compile_template(content)
+        return self._template_renderer
+
     def _create_dtfx_file(
         self,
         host_name: str,
@@ -468,26 +741,42 @@ class DataTransferManager:
         Raises:
             ConfigurationError: If there's an error creating the DTFX file
         """
+        # Refresh the template before consulting the reuse cache: a changed
+        # template clears _dtfx_cache (see _install_template), so the check
+        # below can never serve a file rendered from a stale template.
+        render = self._get_template_renderer()
+
+        # Skip re-rendering when an identical DTFX file was already written
+        # by this manager (e.g. repeated jobs in a cron scenario).
+        cache_key = hashlib.blake2b(
+            f"{host_name}|{source_schema}|{source_table}|{sql_statement}".encode(),
+            digest_size=16
+        ).digest()
+        if (
+            self._dtfx_cache.get(cache_key) == output_path
+            and os.path.exists(output_path)
+        ):
+            logger.debug(f"Reusing existing DTFX file at {output_path}")
+            return
+
         try:
-            template = self._get_template_content()
-            
-            # Replace parameters in the template
-            replacements = {
-                '{{database}}': self.config.database,
-                '{{local_raw_data_directory}}': self.config.local_raw_data_directory,
-                '{{local_data_package_directory}}': self.config.local_data_package_directory,
-                '{{source_schema}}': source_schema,
-                '{{source_table}}': source_table,
-                '{{sql_statement}}': sql_statement,
-                '{{host_name}}': host_name
-            }
-            
-            for key, value in replacements.items():
-                template = template.replace(key, value)
-            
-            # Write the DTFX file
-            with open(output_path, 'w') as file:
-                file.write(template)
+            # Substitute all parameters in a single pass over the template
+            rendered = render({
+                'database': self.config.database,
+                'local_raw_data_directory': self.config.local_raw_data_directory,
+                'local_data_package_directory': self.config.local_data_package_directory,
+                'source_schema': source_schema,
+                'source_table': source_table,
+                'sql_statement': sql_statement,
+                'host_name': host_name
+            })
+
+            # Write the DTFX file as a single pre-encoded buffer; binary mode
+            # avoids per-write encoding and newline translation passes.
+            data = rendered.encode('utf-8')
+            with open(output_path, 'wb', buffering=0) as file:
+                file.write(data)
+            self._dtfx_cache[cache_key] = output_path
             logger.debug(f"Created DTFX file at {output_path}")
             
         except Exception as e:
@@ -519,20 +808,29 @@ class DataTransferManager:
             ConfigurationError: If there's an error in the configuration
             ValidationError: If the transfer fails
         """
-        # Convert single values to lists for consistent processing
-        schemas = [source_schema] if isinstance(source_schema, str) else source_schema
-        tables = [source_table] if isinstance(source_table, str) else source_table
+        # Convert single values to lists for consistent processing. Schema and
+        # table names repeat heavily across realistic batches (one schema,
+        # hundreds of tables), so intern them: the cached path builder and the
+        # DTFX skip cache then hash and compare pointers instead of characters.
+        if isinstance(source_schema, str):
+            schemas = [sys.intern(source_schema)]
+        else:
+            schemas = [sys.intern(s) for s in source_schema]
+        if isinstance(source_table, str):
+            tables = [sys.intern(source_table)]
+        else:
+            tables = [sys.intern(t) for t in source_table]
         statements = [sql_statement] if isinstance(sql_statement, str) else sql_statement
         
-        # Validate lists have same length
-        if not (len(schemas) == len(tables) == len(statements)):
+        # Validate lists have same length with a single upfront check
+        if len({len(schemas), len(tables), len(statements)}) != 1:
             error_msg = "source_schema, source_table, and sql_statement lists must have the same length"
             logger.error(error_msg)
             raise ValidationError(error_msg)
             
         # Create output directory if specified
         if output_directory:
-            os.makedirs(output_directory, exist_ok=True)
+            self._ensure_directory(output_directory)
         else:
             output_directory = self.config.local_raw_data_directory
         
@@ -541,10 +839,8 @@ class DataTransferManager:
         # Phase 1: Build all DTFX files
         dtfx_files = []
         for schema, table, sql in zip(schemas, tables, statements):
-            dtfx_path = os.path.join(
-                self.config.local_data_package_directory,
-                f"{schema}_{table}.dtfx"
-            )
+            dtfx_path = _build_output_path(self._dtfx_str, schema, table, '.dtfx')
+            self._validate_transfer_inputs(schema, table, sql, dtfx_path)
             self._create_dtfx_file(
                 host_name=self.config.host_name,
                 source_schema=schema,
@@ -555,91 +851,140 @@ class DataTransferManager:
             dtfx_files.append((dtfx_path, schema, table))
         
         # Phase 2: Execute DTFX files in parallel batches
-        for i in range(0, len(dtfx_files), self.config.batch_size):
-            batch = dtfx_files[i:i + self.config.batch_size]
-            processes = []
-            
-            logger.info(f"Processing batch {i//self.config.batch_size + 1} of {(len(dtfx_files) + self.config.batch_size - 1)//self.config.batch_size}")
-            
+        batch_size = self.config.batch_size
+        total_batches = (len(dtfx_files) + batch_size - 1) // batch_size
+        for i in range(0, len(dtfx_files), batch_size):
+            batch = dtfx_files[i:i + batch_size]
+
+            logger.info(f"Processing batch {i//batch_size + 1} of {total_batches}")
+
             # Start all transfers in the batch concurrently
-            for dtfx_path, schema, table in batch:
-                command = f'"{self.config.acs_launcher_path}" /PLUGIN=download "{dtfx_path}"'
-                logger.debug(f"Executing command for {schema}.{table}: {command}")
-                process = subprocess.Popen(
-                    command,
-                    shell=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    encoding='utf-8',
-                    creationflags=subprocess.CREATE_NO_WINDOW  # Prevent window from showing
-                )
-                processes.append((dtfx_path, schema, table, process))
-            
-            # Wait for all processes in the batch to complete
-            for dtfx_path, schema, table, process in processes:
-                start_time = datetime.now()
-                try:
-                    # Add a small delay to ensure output is captured
-                    time.sleep(1)
-                    stdout, stderr = process.communicate()
-                    end_time = datetime.now()
-                    duration = (end_time - start_time).total_seconds()
-                    success = process.returncode == 0
-                    
-                    # Extract row count from output with improved parsing
-                    row_count = None
-                    if stdout:
-                        for line in stdout.split('\n'):
-                            if 'rows' in line.lower():
-                                import re
-                                # Look for patterns like "X rows" or "X row" or "X records"
-                                row_match = re.search(r'rows transferred:\s*(\d+)', line.lower())
-                                if row_match:
-                                    row_count = int(row_match.group(1))
-                                    break
-                    
-                    result = DataTransferResult(
-                        start_time=start_time,
-                        end_time=end_time,
-                        duration=duration,
-                        row_count=row_count,
-                        output=stdout,
-                        success=success,
-                        error=stderr if not success else None,
-                        file_path=os.path.join(output_directory, f"{schema}_{table}.csv"),
-                        source_schema=schema,
-                        source_table=table
-                    )
-                    
-                    if success:
-                        logger.info(f"Transfer completed successfully for {schema}.{table} ({row_count} rows)")
-                    else:
-                        logger.error(f"Transfer failed for {schema}.{table}: {stderr}")
-                    
-                    yield result
-                    
-                except Exception as e:
-                    end_time = datetime.now()
-                    duration = (end_time - start_time).total_seconds()
-                    logger.error(f"Unexpected error during transfer for {schema}.{table}: {str(e)}")
-                    yield DataTransferResult(
-                        start_time=start_time,
-                        end_time=end_time,
-                        duration=duration,
-                        row_count=None,
-                        output=None,
-                        success=False,
-                        error=str(e),
-                        file_path=dtfx_path,
-                        source_schema=schema,
-                        source_table=table
+            processes = [
+                self._spawn_transfer(dtfx_path, schema, table)
+                for dtfx_path, schema, table in batch
+            ]
+
+            # Wait for completion in worker threads; the next batch starts as
+            # soon as this one finishes rather than after a fixed sleep.
+            with ThreadPoolExecutor(max_workers=len(processes)) as executor:
+                futures = [
+                    executor.submit(
+                        self._finalize_transfer,
+                        dtfx_path, schema, table, process, start_time,
+                        output_directory
                     )
-            
-            # Wait between batches if not the last batch
-            if i + self.config.batch_size < len(dtfx_files):
-                logger.info("Waiting 15 seconds before next batch...")
-                time.sleep(15)  # Wait 15 seconds between batches
+                    for dtfx_path, schema, table, process, start_time in processes
+                ]
+                for future in futures:
+                    yield future.result()
+
+    def _spawn_transfer(
+        self,
+        dtfx_path: str,
+        schema: str,
+        table: str
+    ) -> Tuple[str, str, str, subprocess.Popen, datetime]:
+        """Launch the ACS download process for a single DTFX file.
+
+        Args:
+            dtfx_path: Path to the DTFX file
+            schema: Source schema name
+            table: Source table name
+
+        Returns:
+            Tuple containing the DTFX path, schema, table, the launched
+            process, and the launch timestamp
+        """
+        command = [self.config.acs_launcher_path, '/PLUGIN=download', dtfx_path]
+        logger.debug(f"Executing command for {schema}.{table}: {command}")
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            # Prevent a console window from showing on Windows
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+        )
+        return dtfx_path, schema, table, process, datetime.now()
+
+    def _finalize_transfer(
+        self,
+        dtfx_path: str,
+        schema: str,
+        table: str,
+        process: subprocess.Popen,
+        start_time: datetime,
+        output_directory: str
+    ) -> DataTransferResult:
+        """Wait for a launched transfer process and build its result.
+
+        Args:
+            dtfx_path: Path to the DTFX file
+            schema: Source schema name
+            table: Source table name
+            process: The running ACS download process
+            start_time: When the process was launched
+            output_directory: Directory where the output file is written
+
+        Returns:
+            DataTransferResult: Result of the transfer operation
+        """
+        stdout = None
+        stderr = None
+        launch_error: Optional[str] = None
+        try:
+            stdout, stderr = process.communicate()
+        except (subprocess.SubprocessError, OSError) as e:
+            launch_error = str(e)
+
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+
+        if launch_error is not None:
+            logger.error(f"Unexpected error during transfer for {schema}.{table}: {launch_error}")
+            return DataTransferResult(
+                start_time=start_time,
+                end_time=end_time,
+                duration=duration,
+                row_count=None,
+                output=None,
+                success=False,
+                error=launch_error,
+                file_path=dtfx_path,
+                source_schema=schema,
+                source_table=table
+            )
+
+        success = process.returncode == 0
+
+        # Extract row count by scanning the output buffer once with the
+        # precompiled pattern instead of lowercasing line by line.
+        row_count = None
+        if stdout:
+            row_match = _ROW_COUNT_RE.search(stdout)
+            if row_match:
+                row_count = int(row_match.group(1))
+
+        result = DataTransferResult(
+            start_time=start_time,
+            end_time=end_time,
+            duration=duration,
+            row_count=row_count,
+            output=stdout,
+            success=success,
+            error=stderr if not success else None,
+            file_path=_build_output_path(output_directory, schema, table, '.csv'),
+            source_schema=schema,
+            source_table=table
+        )
+
+        if success:
+            logger.info(f"Transfer completed successfully for {schema}.{table} ({row_count} rows)")
+        else:
+            logger.error(f"Transfer failed for {schema}.{table}: {stderr}")
+
+        return result
 
     def execute_transfers(
         self,
@@ -697,28 +1042,41 @@ class DataTransferManager:
             print(f"Total rows transferred: {df['row_count'].sum()}")
         """
         batch_start_time = datetime.now()
-        
-        results = list(self.transfer_data(
+
+        transfers = self.transfer_data(
             source_schema=source_schema,
             source_table=source_table,
             sql_statement=sql_statement,
             output_directory=output_directory
-        ))
-        
+        )
+
+        if return_dataframe:
+            # Stream results into columnar buffers instead of holding a list
+            # of DataTransferResult objects plus a DataFrame in memory at once.
+            columns: Dict[str, List[Any]] = {}
+            for result in transfers:
+                for key, value in result.to_dict().items():
+                    columns.setdefault(key, []).append(value)
+
+            batch_end_time = datetime.now()
+            batch_duration = (batch_end_time - batch_start_time).total_seconds()
+
+            df = pd.DataFrame(columns)
+            # Add batch timing information to DataFrame
+            df['batch_start_time'] = batch_start_time
+            df['batch_end_time'] = batch_end_time
+            df['batch_duration'] = batch_duration
+            return df
+
+        results = list(transfers)
+
         batch_end_time = datetime.now()
         batch_duration = (batch_end_time - batch_start_time).total_seconds()
-        
+
         # Add batch timing information to each result
         for result in results:
             result.batch_start_time = batch_start_time
             result.batch_end_time = batch_end_time
             result.batch_duration = batch_duration
-        
-        if return_dataframe:
-            df = pd.concat([result.to_dataframe() for result in results], ignore_index=True)
-            # Add batch timing information to DataFrame
-            df['batch_start_time'] = batch_start_time
-            df['batch_end_time'] = batch_end_time
-            df['batch_duration'] = batch_duration
-            return df
+
         return results 
\ No newline at end of file
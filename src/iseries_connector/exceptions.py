@@ -1,21 +1,34 @@
 """Common exceptions for iSeries connector modules."""
 
+import sys
+
+
 class ISeriesConnectorError(Exception):
     """Base exception for all iSeries connector related errors."""
-    pass
 
 class ConnectionError(ISeriesConnectorError):
     """Exception raised for connection related errors."""
-    pass
 
 class QueryError(ISeriesConnectorError):
     """Exception raised for query execution errors."""
-    pass
 
 class ConfigurationError(ISeriesConnectorError):
     """Exception raised for configuration related errors."""
-    pass
 
 class ValidationError(ISeriesConnectorError):
     """Exception raised for validation related errors."""
-    pass 
\ No newline at end of file
+
+    @classmethod
+    def missing_field(cls, name: str) -> 'ValidationError':
+        """Build a ValidationError for a missing required field.
+
+        The formatted message is interned so repeated raises for the
+        same field share one string.
+
+        Args:
+            name (str): Name of the missing field
+
+        Returns:
+            ValidationError: The constructed exception
+        """
+        return cls(sys.intern(f"{name} is required"))
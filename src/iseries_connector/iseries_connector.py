@@ -1,11 +1,15 @@
 import pandas as pd
 import pyodbc
+import functools
 import os
+import queue
+import random
 import warnings
 import time
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Union, List, Dict, Optional, Any, Generator
+from typing import Union, List, Dict, Optional, Any, ClassVar, Generator, Tuple
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor
 from .exceptions import (
@@ -22,6 +26,16 @@ logger.addHandler(logging.NullHandler())
 # Suppress warnings
 warnings.filterwarnings("ignore", category=UserWarning)
 
+# Upper bound on threads (and therefore pooled connections) used for
+# parallel statement execution
+_MAX_PARALLEL_WORKERS = 16
+
+# Maximum number of query results kept by fetch(cache=True)
+_FETCH_CACHE_MAX = 32
+
+# Ceiling on the exponential backoff between connection retries (seconds)
+_MAX_RETRY_DELAY = 30.0
+
 
 def load_env(path: Optional[str] = None) -> None:
     """
@@ -56,7 +70,7 @@ def load_env(path: Optional[str] = None) -> None:
     if "ISERIES_USER" in os.environ and "ISERIES_USERNAME" not in os.environ:
         os.environ["ISERIES_USERNAME"] = os.environ["ISERIES_USER"]
 
-@dataclass
+@dataclass(frozen=True)
 class ISeriesConfig:
     """
     Configuration for iSeries connection.
@@ -94,7 +108,10 @@ class ISeriesConfig:
     timeout: int = 30
     max_retries: int = 3
     retry_delay: int = 5
-    
+
+    # Cached from_env result, used when ISERIES_CACHE_ENV=1
+    _env_cache: ClassVar[Optional['ISeriesConfig']] = None
+
     @classmethod
     def from_env(cls) -> 'ISeriesConfig':
         """Create a configuration from environment variables.
@@ -102,9 +119,17 @@ class ISeriesConfig:
         This first attempts to populate ``os.environ`` from a ``.env``
         file in the current working directory (if present), then reads
         the relevant variables from ``os.environ``.
+
+        When ``ISERIES_CACHE_ENV=1`` is set, the parsed configuration is
+        cached and reused on subsequent calls, skipping the re-parsing of
+        environment variables. Use :meth:`invalidate_env_cache` after
+        changing the environment at runtime.
         """
+        use_cache = os.environ.get('ISERIES_CACHE_ENV') == '1'
+        if use_cache and cls._env_cache is not None:
+            return cls._env_cache
         load_env()
-        return cls(
+        config = cls(
             dsn=os.environ.get('ISERIES_DSN', ''),
             username=os.environ.get('ISERIES_USERNAME', ''),
             password=os.environ.get('ISERIES_PASSWORD', ''),
@@ -112,7 +137,24 @@ class ISeriesConfig:
             max_retries=int(os.environ.get('ISERIES_MAX_RETRIES', '3')),
             retry_delay=int(os.environ.get('ISERIES_RETRY_DELAY', '5'))
         )
-    
+        if use_cache:
+            cls._env_cache = config
+        return config
+
+    @classmethod
+    def invalidate_env_cache(cls) -> None:
+        """Discard the configuration cached by ``from_env``."""
+        cls._env_cache = None
+
+    @functools.cached_property
+    def odbc_conn_str(self) -> str:
+        """The ODBC connection string, formatted once per configuration.
+
+        Returns:
+            str: The 'DSN=...;UID=...;PWD=...' connection string
+        """
+        return f"DSN={self.dsn};UID={self.username};PWD={self.password}"
+
     def validate(self) -> None:
         """Validate the configuration parameters.
         
@@ -208,6 +250,11 @@ class ISeriesConn:
             )
         self.conn: Optional[pyodbc.Connection] = None
         self.echo: bool = False
+        # Pool of connections reused by parallel statement execution
+        self._pool: "queue.Queue[pyodbc.Connection]" = queue.Queue()
+        # Opt-in result cache for repeated fetch(cache=True) queries,
+        # keyed on (query, dtype_backend)
+        self._fetch_cache: "OrderedDict[Tuple[str, Optional[str]], pd.DataFrame]" = OrderedDict()
         self._validate_config()
     
     def __str__(self) -> str:
@@ -256,9 +303,7 @@ class ISeriesConn:
         Raises:
             ConnectionError: If there's an error establishing the connection
         """
-        return pyodbc.connect(
-            f"DSN={self.config.dsn};UID={self.config.username};PWD={self.config.password}"
-        )
+        return pyodbc.connect(self.config.odbc_conn_str)
     
     def _get_cursor(self) -> pyodbc.Cursor:
         """Get a database cursor. Override this method for testing.
@@ -302,7 +347,11 @@ class ISeriesConn:
     def connect(self) -> pyodbc.Connection:
         """
         Establishes a connection to an iSeries database using credentials.
-        Implements retry logic for transient failures.
+        Implements retry logic for transient failures, backing off
+        exponentially with jitter between attempts: the first retry waits
+        around ``retry_delay`` seconds and each subsequent wait doubles
+        (capped at 30s), scaled by a random factor so simultaneous clients
+        don't retry in lockstep.
 
         Returns:
             pyodbc.Connection: A connection object to the iSeries database
@@ -318,7 +367,8 @@ class ISeriesConn:
                 if attempt == self.config.max_retries - 1:
                     raise ConnectionError(f"Failed to connect after {self.config.max_retries} attempts: {str(e)}")
                 logger.warning(f"Connection attempt {attempt + 1} failed: {str(e)}")
-                time.sleep(self.config.retry_delay)
+                delay = min(self.config.retry_delay * (2 ** attempt), _MAX_RETRY_DELAY)
+                time.sleep(delay * random.uniform(0.5, 1.5))
 
     def __enter__(self) -> 'ISeriesConn':
         """Context manager entry"""
@@ -329,9 +379,28 @@ class ISeriesConn:
         """Context manager exit"""
         self.close()
 
+    def _acquire_connection(self) -> pyodbc.Connection:
+        """Get a connection from the pool, creating one if the pool is empty.
+
+        Returns:
+            pyodbc.Connection: A database connection instance
+        """
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._get_connection()
+
+    def _release_connection(self, conn: pyodbc.Connection) -> None:
+        """Return a connection to the pool for reuse.
+
+        Args:
+            conn (pyodbc.Connection): The connection to return
+        """
+        self._pool.put(conn)
+
     def close(self) -> None:
         """
-        Closes the database connection if it exists.
+        Closes the database connection and any pooled connections.
         """
         if self.conn is not None:
             try:
@@ -341,11 +410,24 @@ class ISeriesConn:
             finally:
                 self.conn = None
 
+        # Drain and close any connections left in the pool
+        while True:
+            try:
+                pooled = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                pooled.close()
+            except Exception as e:
+                logger.error(f"Error closing pooled connection: {str(e)}")
+
     def fetch(
         self,
         query: str,
         echo: Optional[bool] = None,
-        chunksize: Optional[int] = None
+        chunksize: Optional[int] = None,
+        dtype_backend: Optional[str] = None,
+        cache: bool = False
     ) -> Union[pd.DataFrame, Generator[pd.DataFrame, None, None]]:
         """
         Executes a SQL query using the connection and returns the results.
@@ -355,9 +437,22 @@ class ISeriesConn:
             echo (Optional[bool]): Whether to print the query before execution
             chunksize (Optional[int]): Size of chunks to read data in. If None, reads all data at once.
                                      When specified, returns a generator of DataFrames.
+            dtype_backend (Optional[str]): Backend for the resulting DataFrame dtypes,
+                                     e.g. 'pyarrow' to store columns in Arrow buffers
+                                     instead of per-cell Python objects. Requires
+                                     pyarrow to be installed. Defaults to pandas'
+                                     standard numpy-backed dtypes.
+            cache (bool): If True, the result is kept in a small per-connection
+                                     cache keyed on the query text and dtype
+                                     backend, and a repeated fetch of the same
+                                     query returns a copy without a database
+                                     round trip. Ignored when chunksize is
+                                     specified. Only use for queries whose
+                                     results are stable for the connection's
+                                     lifetime.
 
         Returns:
-            Union[pd.DataFrame, Generator[pd.DataFrame, None, None]]: 
+            Union[pd.DataFrame, Generator[pd.DataFrame, None, None]]:
                 If chunksize is None, returns the result as a DataFrame.
                 If chunksize is specified, returns a generator of DataFrames.
 
@@ -365,10 +460,20 @@ class ISeriesConn:
             QueryError: If there's an error executing the query
             ConnectionError: If there's an error with the database connection
         """
+        query = query.replace(";", "")
+
+        # Keyed on the backend too: the same query fetched with
+        # dtype_backend='pyarrow' must not be served a numpy-backed frame
+        fetch_cache_key = (query, dtype_backend)
+        if cache and not chunksize:
+            cached = self._fetch_cache.get(fetch_cache_key)
+            if cached is not None:
+                self._fetch_cache.move_to_end(fetch_cache_key)
+                return cached.copy()
+
         if self.conn is None:
             self.connect()
 
-        query = query.replace(";", "")
         echo = echo if echo is not None else self.echo
 
         if echo:
@@ -376,18 +481,128 @@ class ISeriesConn:
 
         try:
             if chunksize:
-                return pd.read_sql(sql=query, con=self.conn, chunksize=chunksize)
+                cursor = self.conn.cursor()
+                try:
+                    cursor.execute(query)
+                except Exception:
+                    cursor.close()
+                    raise
+                return self._fetch_chunks(cursor, chunksize, dtype_backend)
             else:
-                return pd.read_sql(sql=query, con=self.conn)
-        
+                if dtype_backend is not None:
+                    result = pd.read_sql(
+                        sql=query, con=self.conn, dtype_backend=dtype_backend
+                    )
+                else:
+                    result = pd.read_sql(sql=query, con=self.conn)
+
         except Exception as e:
             raise QueryError(f"Error executing query: {str(e)}")
 
+        if cache:
+            self._fetch_cache[fetch_cache_key] = result.copy()
+            if len(self._fetch_cache) > _FETCH_CACHE_MAX:
+                self._fetch_cache.popitem(last=False)
+
+        return result
+
+    def fetch_to_arrow_file(
+        self,
+        query: str,
+        path: str,
+        chunksize: int = 50_000,
+        echo: Optional[bool] = None
+    ) -> int:
+        """
+        Stream a query result into an Arrow IPC stream file chunk by chunk.
+
+        Unlike collecting chunks with ``pd.concat``, this keeps peak memory
+        bounded by ``chunksize`` rows: each chunk is converted to an Arrow
+        record batch and appended to the file as it arrives. Downstream
+        readers can memory-map the file for zero-copy access. Requires
+        pyarrow (install the ``arrow`` extra).
+
+        Args:
+            query (str): The SQL query to be executed
+            path (str): Destination path for the Arrow IPC stream file
+            chunksize (int): Number of rows fetched and written per batch
+            echo (Optional[bool]): Whether to print the query before execution
+
+        Returns:
+            int: Total number of rows written
+
+        Raises:
+            ISeriesConnectorError: If pyarrow is not installed
+            QueryError: If there's an error executing the query
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ISeriesConnectorError(
+                "pyarrow is required for fetch_to_arrow_file; "
+                "install iseries-connector[arrow]"
+            )
+
+        writer = None
+        total_rows = 0
+        sink = pa.OSFile(path, 'wb')
+        try:
+            for chunk in self.fetch(query, echo=echo, chunksize=chunksize):
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pa.ipc.new_stream(sink, table.schema)
+                writer.write_table(table)
+                total_rows += table.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+            sink.close()
+
+        return total_rows
+
+    @staticmethod
+    def _fetch_chunks(
+        cursor: pyodbc.Cursor,
+        chunksize: int,
+        dtype_backend: Optional[str] = None
+    ) -> Generator[pd.DataFrame, None, None]:
+        """
+        Yield DataFrames of up to ``chunksize`` rows from an executed cursor.
+
+        Column metadata is read once from the cursor description, and the
+        cursor is closed when iteration finishes or is abandoned, so a
+        partially consumed stream does not leak the cursor.
+
+        Args:
+            cursor (pyodbc.Cursor): A cursor with an executed query
+            chunksize (int): Maximum number of rows per DataFrame
+            dtype_backend (Optional[str]): Backend for the chunk dtypes,
+                e.g. 'pyarrow'. Defaults to numpy-backed dtypes.
+
+        Yields:
+            pd.DataFrame: The next chunk of the result set
+        """
+        try:
+            columns = [col[0] for col in cursor.description]
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                chunk = pd.DataFrame.from_records(
+                    [tuple(row) for row in rows], columns=columns
+                )
+                if dtype_backend is not None:
+                    chunk = chunk.convert_dtypes(dtype_backend=dtype_backend)
+                yield chunk
+        finally:
+            cursor.close()
+
     def execute_statements(
         self, 
-        statements: Union[str, List[str]], 
+        statements: Union[str, List[str]],
         parallel: bool = False,
-        echo: Optional[bool] = None
+        echo: Optional[bool] = None,
+        coalesce: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Executes one or more SQL statements in iSeries and returns the results.
@@ -397,6 +612,10 @@ class ISeriesConn:
             parallel (bool): If True, executes statements in parallel using separate connections.
                            If False, executes statements sequentially using the same connection.
             echo (Optional[bool]): Whether to print the query before execution
+            coalesce (bool): If True (sequential only), the statements are joined
+                           into a single BEGIN...END compound block and submitted
+                           in one round trip. The statements succeed or fail
+                           together and share one measured duration.
 
         Returns:
             List[Dict[str, Any]]: List of dictionaries containing execution results.
@@ -409,51 +628,115 @@ class ISeriesConn:
         if isinstance(statements, str):
             statements = [statements]
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         echo = echo if echo is not None else self.echo
 
         if not parallel:
             if self.conn is None:
                 self.connect()
 
+            if coalesce and len(statements) > 1:
+                return self._execute_coalesced(statements, echo)
+
             results = []
-            for statement in statements:
-                sanitized_statement = statement.replace(";", "")
-                statement_start_time = time.time()
-                with self.conn.cursor() as cursor:
+            # A single cursor is reused for the whole batch; allocating one
+            # statement handle per statement costs an extra driver round trip
+            # for what are typically many small DDL/DML statements.
+            with self.conn.cursor() as cursor:
+                for statement in statements:
+                    sanitized_statement = statement.replace(";", "")
+                    statement_start_time = time.perf_counter()
                     try:
                         cursor.execute(sanitized_statement)
+                        duration = time.perf_counter() - statement_start_time
                         results.append({
                             "success": True,
                             "statement": sanitized_statement,
-                            "duration": time.time() - statement_start_time
+                            "duration": duration
                         })
                         if echo:
                             logger.info(
                                 f"Success: Statement = {sanitized_statement}, "
-                                f"Duration = {time.time() - statement_start_time} seconds"
+                                f"Duration = {duration} seconds"
                             )
                     except Exception as e:
+                        duration = time.perf_counter() - statement_start_time
                         results.append({
                             "success": False,
                             "statement": sanitized_statement,
                             "error": str(e),
-                            "duration": time.time() - statement_start_time
+                            "duration": duration
                         })
                         if echo:
                             logger.error(
                                 f"Failed: Statement = {sanitized_statement}, "
-                                f"Duration = {time.time() - statement_start_time} seconds"
+                                f"Duration = {duration} seconds"
                             )
         else:
-            with ThreadPoolExecutor(max_workers=len(statements)) as executor:
+            # Bound concurrency so large batches don't spawn one thread (and
+            # one ODBC connection) per statement.
+            max_workers = min(len(statements), _MAX_PARALLEL_WORKERS)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 results = list(executor.map(self._execute_single_statement, statements))
 
-        end_time = time.time()
+        end_time = time.perf_counter()
         if echo:
             logger.info(f"Total time taken to execute {len(statements)} statements: {end_time - start_time} seconds")
         return results
 
+    def _execute_coalesced(
+        self,
+        statements: List[str],
+        echo: bool
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a batch of statements as one BEGIN...END compound block.
+
+        Submitting the block as a single execute collapses N driver round
+        trips into one. The statements succeed or fail as a unit, so every
+        result entry carries the same outcome and duration.
+
+        Args:
+            statements (List[str]): The SQL statements to execute
+            echo (bool): Whether to log the outcome
+
+        Returns:
+            List[Dict[str, Any]]: One result dictionary per statement
+        """
+        sanitized = [statement.replace(";", "") for statement in statements]
+        block = "BEGIN\n" + ";\n".join(sanitized) + ";\nEND"
+        block_start_time = time.perf_counter()
+
+        with self.conn.cursor() as cursor:
+            try:
+                cursor.execute(block)
+                duration = time.perf_counter() - block_start_time
+                if echo:
+                    logger.info(
+                        f"Success: Coalesced {len(sanitized)} statements, "
+                        f"Duration = {duration} seconds"
+                    )
+                return [
+                    {"success": True, "statement": s, "duration": duration}
+                    for s in sanitized
+                ]
+            except Exception as e:
+                duration = time.perf_counter() - block_start_time
+                if echo:
+                    logger.error(
+                        f"Failed: Coalesced {len(sanitized)} statements, "
+                        f"Duration = {duration} seconds"
+                    )
+                return [
+                    {
+                        "success": False,
+                        "statement": s,
+                        "error": str(e),
+                        "duration": duration
+                    }
+                    for s in sanitized
+                ]
+
     def _execute_single_statement(self, stmt: str) -> Dict[str, Any]:
         """
         Execute a single statement in its own connection.
@@ -468,45 +751,48 @@ class ISeriesConn:
                 - 'error' (str): Error message if execution failed (only present if success is False)
                 - 'duration' (float): Time taken to execute the statement in seconds
         """
-        statement_start_time = time.time()
+        statement_start_time = time.perf_counter()
 
-        # Create a new connection for this thread
-        conn = self._get_connection()
+        # Reuse a pooled connection for this thread, creating one only when
+        # the pool is empty, so M statements cost at most P handshakes.
+        conn = self._acquire_connection()
         sanitized_stmt = stmt.replace(";", "")
 
         try:
             cursor = conn.cursor()
             cursor.execute(sanitized_stmt)
             conn.commit()
+            duration = time.perf_counter() - statement_start_time
             result = {
                 "statement": sanitized_stmt,
                 "success": True,
-                "duration": time.time() - statement_start_time
+                "duration": duration
             }
             if self.echo:
                 logger.info(
                     f"Success: Statement = {sanitized_stmt}, "
-                    f"Duration = {time.time() - statement_start_time} seconds"
+                    f"Duration = {duration} seconds"
                 )
             return result
 
         except Exception as e:
+            duration = time.perf_counter() - statement_start_time
             result = {
                 "statement": sanitized_stmt,
                 "success": False,
                 "error": str(e),
-                "duration": time.time() - statement_start_time
+                "duration": duration
             }
             if self.echo:
                 logger.error(
                     f"Failed: Statement = {sanitized_stmt}, "
-                    f"Duration = {time.time() - statement_start_time} seconds"
+                    f"Duration = {duration} seconds"
                 )
             return result
         
         finally:
             cursor.close()
-            conn.close()
+            self._release_connection(conn)
 
     def _parse_sql_file(self, path: str) -> List[str]:
         """
@@ -559,36 +845,38 @@ class ISeriesConn:
 
         for statement in statements:
             sanitized_statement = statement.replace(";", "")
-            statement_start_time = time.time()
+            statement_start_time = time.perf_counter()
             cursor = conn.cursor()
             try:
                 cursor.execute(sanitized_statement)
                 conn.commit()
+                duration = time.perf_counter() - statement_start_time
                 results.append(
                     {
                         "success": True,
                         "statement": sanitized_statement,
-                        "duration": time.time() - statement_start_time,
+                        "duration": duration,
                     }
                 )
                 if echo:
                     logger.info(
                         f"Success: Statement = {sanitized_statement}, "
-                        f"Duration = {time.time() - statement_start_time} seconds"
+                        f"Duration = {duration} seconds"
                     )
             except Exception as e:
+                duration = time.perf_counter() - statement_start_time
                 results.append(
                     {
                         "success": False,
                         "statement": sanitized_statement,
                         "error": str(e),
-                        "duration": time.time() - statement_start_time,
+                        "duration": duration,
                     }
                 )
                 if echo:
                     logger.error(
                         f"Failed: Statement = {sanitized_statement}, "
-                        f"Duration = {time.time() - statement_start_time} seconds"
+                        f"Duration = {duration} seconds"
                     )
             finally:
                 cursor.close()
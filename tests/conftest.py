@@ -0,0 +1,62 @@
+"""Shared fixtures for the test suite.
+
+The suite is safe to run under pytest-xdist (``pytest -n auto``): shared
+test data is frozen (MappingProxyType constants, merge-literal variants
+instead of copy-and-mutate), module-scoped fixtures live in worker-local
+tmp dirs via tmp_path_factory, and environment patching goes through
+patch.dict so each worker restores its own process environment.
+"""
+
+from pathlib import Path
+from typing import Generator, Tuple
+from unittest.mock import patch, MagicMock
+import pytest
+
+from iseries_connector.data_transfer import DataTransferConfig
+
+
+@pytest.fixture(scope="module")
+def temp_dirs(tmp_path_factory: pytest.TempPathFactory) -> Tuple[Path, Path]:
+    """Create temporary directories for testing.
+
+    The directories are shared by all tests in the module (they are only
+    read from); pytest's numbered temp-dir machinery handles cleanup.
+    """
+    base = tmp_path_factory.mktemp("xfer")
+    raw_data_dir = base / "raw_data"
+    data_package_dir = base / "data_package"
+    raw_data_dir.mkdir()
+    data_package_dir.mkdir()
+    return raw_data_dir, data_package_dir
+
+
+@pytest.fixture(scope="module")
+def mock_acs_launcher() -> str:
+    """Create a mock ACS launcher path."""
+    return str(Path.cwd() / "mock_acs_launcher.exe")
+
+
+@pytest.fixture(scope="module")
+def mock_file_exists() -> Generator[MagicMock, None, None]:
+    """Make file existence checks succeed.
+
+    The patch is created once per module rather than per test; tests
+    that need paths to *not* exist patch locally via monkeypatch instead
+    of mutating this shared mock.
+    """
+    patcher = patch('os.path.exists', MagicMock(return_value=True))
+    yield patcher.start()
+    patcher.stop()
+
+
+@pytest.fixture(scope="module")
+def config(temp_dirs: Tuple[Path, Path], mock_acs_launcher: str) -> DataTransferConfig:
+    """Create a test configuration, shared across the module."""
+    raw_data_dir, data_package_dir = temp_dirs
+    with patch('os.path.exists', return_value=True):
+        return DataTransferConfig(
+            host_name="test.host.com",
+            acs_launcher_path=mock_acs_launcher,
+            local_raw_data_directory=str(raw_data_dir),
+            local_data_package_directory=str(data_package_dir)
+        )
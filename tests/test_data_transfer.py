@@ -1,69 +1,73 @@
 """Tests for the data transfer functionality."""
 
 import os
-import tempfile
+import subprocess
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 import pandas as pd
-from typing import Generator, Tuple, Any
+from typing import Any, Callable, Dict, Generator, Tuple
+from iseries_connector import data_transfer as dt_mod
 from iseries_connector.data_transfer import (
     DataTransferConfig,
     DataTransferManager,
     DataTransferResult,
-    ValidationError
+    ValidationError,
+    _path_exists_cached
 )
 
-@pytest.fixture(scope="function")
-def temp_dirs() -> Generator[Tuple[Path, Path], None, None]:
-    """Create temporary directories for testing.
-    
-    The directories are automatically cleaned up after each test.
+# temp_dirs, mock_acs_launcher, mock_file_exists and config live in
+# tests/conftest.py so other test modules can reuse them
+
+@pytest.fixture(scope="module")
+def _popen_patch() -> Generator[MagicMock, None, None]:
+    """Patch subprocess.Popen once for the whole module.
+
+    patch.object on the manager module's own subprocess reference skips
+    the string-target import/attribute resolution inside mock._patch.
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        raw_data_dir = Path(temp_dir) / "raw_data"
-        data_package_dir = Path(temp_dir) / "data_package"
-        raw_data_dir.mkdir()
-        data_package_dir.mkdir()
-        yield raw_data_dir, data_package_dir
-
-@pytest.fixture(scope="function")
-def mock_acs_launcher() -> str:
-    """Create a mock ACS launcher path."""
-    return str(Path.cwd() / "mock_acs_launcher.exe")
-
-@pytest.fixture(scope="function", autouse=True)
-def mock_file_exists() -> Generator[MagicMock, None, None]:
-    """Mock file existence checks.
-    
-    This fixture is automatically used in all tests (autouse=True)
-    and is reset between tests (scope="function").
+    with patch.object(dt_mod.subprocess, 'Popen') as mock_popen:
+        yield mock_popen
+
+@pytest.fixture
+def mock_popen(_popen_patch: MagicMock) -> MagicMock:
+    """Per-test view of the shared Popen mock, reset between tests."""
+    _popen_patch.reset_mock(return_value=True, side_effect=True)
+    return _popen_patch
+
+# The real class, bound before _popen_patch replaces subprocess.Popen
+_REAL_POPEN = subprocess.Popen
+
+def _proc(rc: int = 0, out: str = "rows transferred: 100", err: str = "") -> MagicMock:
+    """Build a Popen-specced process mock with canned output.
+
+    spec keeps the mock's attribute tree small instead of letting
+    MagicMock auto-generate children on every access.
     """
-    with patch('os.path.exists') as mock_exists:
-        mock_exists.return_value = True
-        yield mock_exists
-
-@pytest.fixture(scope="function")
-def config(temp_dirs: Tuple[Path, Path], mock_acs_launcher: str, mock_file_exists: MagicMock) -> DataTransferConfig:
-    """Create a test configuration."""
-    raw_data_dir, data_package_dir = temp_dirs
-    return DataTransferConfig(
-        host_name="test.host.com",
-        acs_launcher_path=mock_acs_launcher,
-        local_raw_data_directory=str(raw_data_dir),
-        local_data_package_directory=str(data_package_dir)
-    )
+    process = MagicMock(spec=_REAL_POPEN)
+    process.returncode = rc
+    process.communicate.return_value = (out, err)
+    return process
+
+@pytest.fixture
+def popen_ok(mock_popen: MagicMock) -> MagicMock:
+    """Popen mock wired for a successful 100-row transfer."""
+    mock_popen.return_value = _proc()
+    return mock_popen
+
+@pytest.fixture
+def popen_fail(mock_popen: MagicMock) -> MagicMock:
+    """Popen mock wired for a failed transfer."""
+    mock_popen.return_value = _proc(rc=1, out="", err="Error: Connection failed")
+    return mock_popen
 
 class TestDataTransferConfig:
     """Test cases for DataTransferConfig class."""
 
     def test_init_with_defaults(self, mock_file_exists: MagicMock) -> None:
         """Test initialization with default values."""
-        # Mock file existence check for the default ACS launcher path
-        mock_file_exists.return_value = True
-        
         config = DataTransferConfig(host_name="test.host.com")
         assert config.host_name == "test.host.com"
         assert config.database == "*SYSBAS"
@@ -134,75 +138,64 @@ class TestDataTransferConfig:
         assert config.local_raw_data_directory == "/tmp/raw"
         assert config.local_data_package_directory == "/tmp/pkg"
 
-    def test_validate_missing_host(self, mock_file_exists: MagicMock) -> None:
-        """Test validation with missing host name."""
-        with pytest.raises(ValidationError, match="Host name is required"):
-            DataTransferConfig(host_name="")
-
-    def test_validate_invalid_acs_path(self, mock_file_exists: MagicMock) -> None:
-        """Test validation with invalid ACS launcher path."""
-        mock_file_exists.return_value = False
-        with pytest.raises(ValidationError, match="ACS Launcher not found"):
-            DataTransferConfig(
-                host_name="test.host.com",
-                acs_launcher_path="nonexistent.exe"
-            )
-
-    def test_validate_invalid_batch_size(self, mock_file_exists: MagicMock) -> None:
-        """Test validation with invalid batch size."""
-        with pytest.raises(ValidationError, match="Batch size must be a positive number"):
-            DataTransferConfig(
-                host_name="test.host.com",
-                batch_size=0
-            )
-
-    def test_validate_invalid_template_path(self, temp_dirs: Tuple[Path, Path], mock_file_exists: MagicMock) -> None:
-        """Test validation with invalid template path."""
-        # Make ACS launcher path check pass but template path check fail
-        def mock_exists(path: str) -> bool:
-            return path == "C:/Program Files/IBMiAccess_v1r1/Start_Programs/Windows_x86-64/acslaunch_win-64.exe"
-        
-        mock_file_exists.side_effect = mock_exists
-        
-        with pytest.raises(ValidationError, match="Template file not found"):
-            DataTransferConfig(
-                host_name="test.host.com",
-                template_path="nonexistent.txt"
-            )
+    @pytest.mark.parametrize("kwargs,exists,match", [
+        pytest.param(
+            {"host_name": ""},
+            lambda path: True,
+            "Host name is required",
+            id="missing-host"
+        ),
+        pytest.param(
+            {"host_name": "test.host.com", "acs_launcher_path": "nonexistent.exe"},
+            lambda path: False,
+            "ACS Launcher not found",
+            id="invalid-acs-path"
+        ),
+        pytest.param(
+            {"host_name": "test.host.com", "batch_size": 0},
+            lambda path: True,
+            "Batch size must be a positive number",
+            id="invalid-batch-size"
+        ),
+        pytest.param(
+            {"host_name": "test.host.com", "template_path": "nonexistent.txt"},
+            lambda path: path != "nonexistent.txt",
+            "Template file not found",
+            id="invalid-template-path"
+        ),
+    ])
+    def test_validate_rejects_invalid_config(
+        self,
+        kwargs: Dict[str, Any],
+        exists: Callable[[str], bool],
+        match: str,
+        monkeypatch: pytest.MonkeyPatch,
+        request: pytest.FixtureRequest
+    ) -> None:
+        """Each invalid field should raise a ValidationError."""
+        monkeypatch.setattr(os.path, 'exists', exists)
+        # Clear entries cached before the monkeypatch, and again on teardown
+        # so values computed under the per-case lambdas don't leak into the
+        # process-global cache for later tests
+        _path_exists_cached.cache_clear()
+        request.addfinalizer(_path_exists_cached.cache_clear)
+        with pytest.raises(ValidationError, match=match):
+            DataTransferConfig(**kwargs)
 
 class TestDataTransferResult:
     """Test cases for DataTransferResult class."""
 
-    def test_init_with_required_fields(self) -> None:
-        """Test initialization with required fields."""
-        start_time = datetime.now()
-        end_time = datetime.now()
-        result = DataTransferResult(
-            start_time=start_time,
-            end_time=end_time,
-            duration=1.0,
-            row_count=100,
-            output="Success",
-            success=True,
-            source_schema="TEST",
-            source_table="TABLE"
-        )
-        
-        assert result.start_time == start_time
-        assert result.end_time == end_time
-        assert result.duration == 1.0
-        assert result.row_count == 100
-        assert result.output == "Success"
-        assert result.success is True
-        assert result.source_schema == "TEST"
-        assert result.source_table == "TABLE"
-        assert result.is_successful is True
-
-    def test_to_dataframe(self) -> None:
-        """Test conversion to DataFrame."""
-        start_time = datetime.now()
-        end_time = datetime.now()
-        result = DataTransferResult(
+    @pytest.fixture(scope="module")
+    def ts(self) -> Tuple[datetime, datetime]:
+        """Deterministic start/end timestamps shared by the result tests."""
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        return start, start + timedelta(seconds=1)
+
+    @pytest.fixture
+    def sample_result(self, ts: Tuple[datetime, datetime]) -> DataTransferResult:
+        """Create a successful result shared by the construction/serialization tests."""
+        start_time, end_time = ts
+        return DataTransferResult(
             start_time=start_time,
             end_time=end_time,
             duration=1.0,
@@ -212,42 +205,57 @@ class TestDataTransferResult:
             source_schema="TEST",
             source_table="TABLE"
         )
-        
-        df = result.to_dataframe()
+
+    def test_init_with_required_fields(self, sample_result: DataTransferResult) -> None:
+        """Test initialization with required fields."""
+        assert sample_result.duration == 1.0
+        assert sample_result.row_count == 100
+        assert sample_result.output == "Success"
+        assert sample_result.success is True
+        assert sample_result.source_schema == "TEST"
+        assert sample_result.source_table == "TABLE"
+        assert sample_result.is_successful is True
+
+    def test_to_dict(self, sample_result: DataTransferResult) -> None:
+        """Test field passthrough via the dictionary representation."""
+        data = sample_result.to_dict()
+        assert data['start_time'] == "2024-01-01T12:00:00"
+        assert data['end_time'] == "2024-01-01T12:00:01"
+        assert data['duration'] == 1.0
+        assert data['row_count'] == 100
+        assert data['success'] is True
+        assert data['source_schema'] == "TEST"
+        assert data['source_table'] == "TABLE"
+
+    def test_to_dataframe_shape(self, sample_result: DataTransferResult) -> None:
+        """to_dataframe should yield one row with the to_dict columns."""
+        df = sample_result.to_dataframe()
         assert len(df) == 1
-        assert df['start_time'].iloc[0] == start_time.isoformat()
-        assert df['end_time'].iloc[0] == end_time.isoformat()
-        assert df['duration'].iloc[0] == 1.0
-        assert df['row_count'].iloc[0] == 100
-        assert bool(df['success'].iloc[0]) is True
-        assert df['source_schema'].iloc[0] == "TEST"
-        assert df['source_table'].iloc[0] == "TABLE"
-
-    def test_to_json(self) -> None:
+        assert df.columns.tolist() == list(sample_result.to_dict().keys())
+
+    def test_to_json(self, sample_result: DataTransferResult) -> None:
         """Test conversion to JSON."""
-        start_time = datetime.now()
-        end_time = datetime.now()
-        result = DataTransferResult(
-            start_time=start_time,
-            end_time=end_time,
-            duration=1.0,
-            row_count=100,
-            output="Success",
-            success=True,
-            source_schema="TEST",
-            source_table="TABLE"
-        )
-        
-        json_str = result.to_json()
+        json_str = sample_result.to_json()
         data = json.loads(json_str)
         assert data['row_count'] == 100
         assert data['success'] is True
         assert data['source_schema'] == "TEST"
         assert data['source_table'] == "TABLE" 
 
+@pytest.mark.transfer
 class TestDataTransferManager:
     """Test cases for DataTransferManager class."""
 
+    @pytest.fixture(scope="module")
+    def csv_path(self, temp_dirs: Tuple[Path, Path]) -> Callable[[str, str], str]:
+        """Build expected CSV paths under the shared raw-data dir on demand.
+
+        The base directory string is computed once per module so the
+        assertions don't re-stringify the Path on every call.
+        """
+        base = str(temp_dirs[0])
+        return lambda schema, table: os.path.join(base, f"{schema}_{table}.csv")
+
     @pytest.fixture
     def manager(self, config: DataTransferConfig, mock_file_exists: MagicMock) -> DataTransferManager:
         """Create a test manager instance."""
@@ -269,20 +277,8 @@ class TestDataTransferManager:
         assert manager.config.host_name == config.host_name
         assert manager.config.acs_launcher_path == config.acs_launcher_path
 
-    @patch('subprocess.Popen')
-    def test_transfer_data_single(self, mock_popen: MagicMock, manager: DataTransferManager, temp_dirs: Tuple[Path, Path], mock_file_exists: MagicMock) -> None:
+    def test_transfer_data_single(self, popen_ok: MagicMock, manager: DataTransferManager, csv_path: Callable[[str, str], str], mock_file_exists: MagicMock) -> None:
         """Test single data transfer."""
-        raw_data_dir, _ = temp_dirs
-        
-        # Mock successful process
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = (
-            "rows transferred: 100",
-            ""
-        )
-        mock_popen.return_value = mock_process
-
         result = next(manager.transfer_data(
             source_schema="TEST",
             source_table="TABLE",
@@ -291,27 +287,15 @@ class TestDataTransferManager:
 
         assert result.is_successful
         assert result.row_count == 100
-        assert result.file_path == str(raw_data_dir / "TEST_TABLE.csv")
+        assert result.file_path == csv_path("TEST", "TABLE")
 
-    @patch('subprocess.Popen')
-    def test_transfer_data_batch(self, mock_popen: MagicMock, manager: DataTransferManager, temp_dirs: Tuple[Path, Path], mock_file_exists: MagicMock) -> None:
+    @pytest.mark.parametrize("n", [1, 2, 10])
+    def test_transfer_data_batch(self, n: int, popen_ok: MagicMock, manager: DataTransferManager, csv_path: Callable[[str, str], str], mock_file_exists: MagicMock) -> None:
         """Test batch data transfer."""
-        raw_data_dir, _ = temp_dirs
-        
-        # Mock successful processes
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = (
-            "rows transferred: 100",
-            ""
-        )
-        mock_popen.return_value = mock_process
-
-        schemas = ["TEST1", "TEST2"]
-        tables = ["TABLE1", "TABLE2"]
+        schemas = [f"TEST{i}" for i in range(1, n + 1)]
+        tables = [f"TABLE{i}" for i in range(1, n + 1)]
         sql_statements = [
-            "SELECT * FROM TEST1.TABLE1",
-            "SELECT * FROM TEST2.TABLE2"
+            f"SELECT * FROM TEST{i}.TABLE{i}" for i in range(1, n + 1)
         ]
 
         results = list(manager.transfer_data(
@@ -320,24 +304,15 @@ class TestDataTransferManager:
             sql_statement=sql_statements
         ))
 
-        assert len(results) == 2
+        assert len(results) == n
         assert all(r.is_successful for r in results)
         assert all(r.row_count == 100 for r in results)
-        assert results[0].file_path == str(raw_data_dir / "TEST1_TABLE1.csv")
-        assert results[1].file_path == str(raw_data_dir / "TEST2_TABLE2.csv")
+        assert [r.file_path for r in results] == [
+            csv_path(schema, table) for schema, table in zip(schemas, tables)
+        ]
 
-    @patch('subprocess.Popen')
-    def test_transfer_data_failure(self, mock_popen: MagicMock, manager: DataTransferManager, mock_file_exists: MagicMock) -> None:
+    def test_transfer_data_failure(self, popen_fail: MagicMock, manager: DataTransferManager, mock_file_exists: MagicMock) -> None:
         """Test failed data transfer."""
-        # Mock failed process
-        mock_process = MagicMock()
-        mock_process.returncode = 1
-        mock_process.communicate.return_value = (
-            "",
-            "Error: Connection failed"
-        )
-        mock_popen.return_value = mock_process
-
         result = next(manager.transfer_data(
             source_schema="TEST",
             source_table="TABLE",
@@ -347,21 +322,11 @@ class TestDataTransferManager:
         assert not result.is_successful
         assert result.error == "Error: Connection failed"
 
-    @patch('subprocess.Popen')
-    def test_transfer_data_custom_output(self, mock_popen: MagicMock, manager: DataTransferManager, temp_dirs: Tuple[Path, Path], mock_file_exists: MagicMock) -> None:
+    def test_transfer_data_custom_output(self, popen_ok: MagicMock, manager: DataTransferManager, temp_dirs: Tuple[Path, Path], mock_file_exists: MagicMock) -> None:
         """Test data transfer with custom output directory."""
         raw_data_dir, _ = temp_dirs
         custom_dir = raw_data_dir / "custom"
         custom_dir.mkdir()
-        
-        # Mock successful process
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = (
-            "rows transferred: 100",
-            ""
-        )
-        mock_popen.return_value = mock_process
 
         result = next(manager.transfer_data(
             source_schema="TEST",
@@ -383,6 +348,107 @@ class TestDataTransferManager:
                 sql_statement=["SELECT * FROM TEST1.TABLE1"]
             )) 
         
+    @pytest.mark.parametrize("schema,table,sql,match", [
+        pytest.param(
+            "", "TABLE", "SELECT 1",
+            "source_schema cannot be empty", id="empty-schema"
+        ),
+        pytest.param(
+            "TEST", "   ", "SELECT 1",
+            "source_table cannot be empty", id="blank-table"
+        ),
+        pytest.param(
+            "TEST", "TABLE", "",
+            "sql_statement cannot be empty", id="empty-sql"
+        ),
+        pytest.param(
+            "TEST", "TABLE", "DELETE FROM TEST.TABLE",
+            "must be a SELECT statement", id="non-select"
+        ),
+    ])
+    def test_validate_transfer_inputs_rejects(
+        self,
+        schema: str,
+        table: str,
+        sql: str,
+        match: str,
+        manager: DataTransferManager,
+        mock_file_exists: MagicMock
+    ) -> None:
+        """Each invalid transfer input should raise a ValidationError."""
+        with pytest.raises(ValidationError, match=match):
+            manager._validate_transfer_inputs(schema, table, sql, "out.dtfx")
+
+    def test_validate_transfer_inputs_accepts_cte(self, manager: DataTransferManager, mock_file_exists: MagicMock) -> None:
+        """A WITH-prefixed CTE is a valid download query, not just bare SELECTs."""
+        manager._validate_transfer_inputs(
+            "TEST", "TABLE",
+            "WITH recent AS (SELECT * FROM TEST.TABLE) SELECT * FROM recent",
+            "out.dtfx"
+        )
+
+    def test_validate_transfer_inputs_rejects_long_windows_path(
+        self,
+        manager: DataTransferManager,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_file_exists: MagicMock
+    ) -> None:
+        """DTFX paths beyond the Windows limit should be rejected on nt."""
+        monkeypatch.setattr(dt_mod.os, 'name', 'nt')
+        long_path = "C:\\" + "a" * 300 + ".dtfx"
+        with pytest.raises(ValidationError, match="Windows path limit"):
+            manager._validate_transfer_inputs("TEST", "TABLE", "SELECT 1", long_path)
+
+    def test_template_edit_invalidates_dtfx_cache(
+        self,
+        config: DataTransferConfig,
+        tmp_path: Path,
+        mock_file_exists: MagicMock
+    ) -> None:
+        """Editing the template must not reuse DTFX files rendered from the old one."""
+        template = tmp_path / "template.txt"
+        template.write_text("HOST={{host_name}} VERSION=1")
+        manager = DataTransferManager(
+            host_name=config.host_name,
+            acs_launcher_path=config.acs_launcher_path,
+            local_raw_data_directory=config.local_raw_data_directory,
+            local_data_package_directory=config.local_data_package_directory,
+            template_path=str(template)
+        )
+        out_path = tmp_path / "out.dtfx"
+
+        manager._create_dtfx_file("host", "TEST", "TABLE", "SELECT 1", str(out_path))
+        assert "VERSION=1" in out_path.read_text()
+
+        template.write_text("HOST={{host_name}} VERSION=2")
+        os.utime(template, (1, 1))  # force a distinct mtime
+        manager._create_dtfx_file("host", "TEST", "TABLE", "SELECT 1", str(out_path))
+        assert "VERSION=2" in out_path.read_text()
+
+    def test_unknown_template_placeholder_kept_verbatim(
+        self,
+        config: DataTransferConfig,
+        tmp_path: Path,
+        mock_file_exists: MagicMock
+    ) -> None:
+        """Placeholders the library doesn't know about survive the render untouched."""
+        template = tmp_path / "template.txt"
+        template.write_text("HOST={{host_name}} EXTRA={{custom_thing}}")
+        manager = DataTransferManager(
+            host_name=config.host_name,
+            acs_launcher_path=config.acs_launcher_path,
+            local_raw_data_directory=config.local_raw_data_directory,
+            local_data_package_directory=config.local_data_package_directory,
+            template_path=str(template)
+        )
+        out_path = tmp_path / "out.dtfx"
+
+        manager._create_dtfx_file("host", "TEST", "TABLE", "SELECT 1", str(out_path))
+
+        content = out_path.read_text()
+        assert "HOST=host" in content
+        assert "EXTRA={{custom_thing}}" in content
+
     def test_manager_can_be_created_from_env_config(
         self,
         tmp_path: Path,
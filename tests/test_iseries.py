@@ -2,6 +2,7 @@
 
 import pytest
 import os
+import types
 from unittest.mock import Mock, patch
 import pandas as pd
 from iseries_connector import ISeriesConn, ISeriesConfig, load_env
@@ -12,15 +13,33 @@ from iseries_connector.exceptions import (
     ValidationError,
 )
 
-# Test data
-TEST_CONFIG = {
+# Test data; read-only so no test can mutate shared state
+TEST_CONFIG = types.MappingProxyType({
     'dsn': 'TEST_ISERIES_DSN',
     'username': 'testuser',
     'password': 'testpass',
     'timeout': 30,
     'max_retries': 3,
     'retry_delay': 5
-}
+})
+
+INVALID_CONFIG_CASES = (
+    ('dsn', '', "DSN cannot be empty"),
+    ('username', '', "Username cannot be empty"),
+    ('password', '', "Password cannot be empty"),
+    ('timeout', 0, "Timeout must be a positive number"),
+    ('max_retries', -1, "Max retries cannot be negative"),
+    ('retry_delay', -1, "Retry delay cannot be negative"),
+)
+
+TEST_ENV_VARS = types.MappingProxyType({
+    'ISERIES_DSN': 'ENV_DSN',
+    'ISERIES_USERNAME': 'env-user',
+    'ISERIES_PASSWORD': 'env-pass',
+    'ISERIES_TIMEOUT': '20',
+    'ISERIES_MAX_RETRIES': '5',
+    'ISERIES_RETRY_DELAY': '10'
+})
 
 @pytest.fixture
 def mock_connection():
@@ -44,12 +63,9 @@ class TestISeriesConfig:
     def test_init_with_direct_values(self):
         """Test initialization with direct values"""
         config = ISeriesConfig(**TEST_CONFIG)
-        assert config.dsn == TEST_CONFIG['dsn']
-        assert config.username == TEST_CONFIG['username']
-        assert config.password == TEST_CONFIG['password']
-        assert config.timeout == TEST_CONFIG['timeout']
-        assert config.max_retries == TEST_CONFIG['max_retries']
-        assert config.retry_delay == TEST_CONFIG['retry_delay']
+        # Compare all attributes in one dict equality so a failure reports
+        # every mismatched field at once
+        assert {k: getattr(config, k) for k in TEST_CONFIG} == TEST_CONFIG
 
     def test_init_with_defaults(self):
         """Test initialization with default values"""
@@ -58,29 +74,23 @@ class TestISeriesConfig:
             username='test-user',
             password='test-pass'
         )
-        assert config.timeout == 30
-        assert config.max_retries == 3
-        assert config.retry_delay == 5
+        expected = {'timeout': 30, 'max_retries': 3, 'retry_delay': 5}
+        assert {k: getattr(config, k) for k in expected} == expected
 
     def test_from_env(self):
         """Test initialization from environment variables"""
-        env_vars = {
-            'ISERIES_DSN': 'ENV_DSN',
-            'ISERIES_USERNAME': 'env-user',
-            'ISERIES_PASSWORD': 'env-pass',
-            'ISERIES_TIMEOUT': '20',
-            'ISERIES_MAX_RETRIES': '5',
-            'ISERIES_RETRY_DELAY': '10'
+        expected = {
+            'dsn': 'ENV_DSN',
+            'username': 'env-user',
+            'password': 'env-pass',
+            'timeout': 20,
+            'max_retries': 5,
+            'retry_delay': 10
         }
-        
-        with patch.dict(os.environ, env_vars):
+
+        with patch.dict(os.environ, TEST_ENV_VARS):
             config = ISeriesConfig.from_env()
-            assert config.dsn == 'ENV_DSN'
-            assert config.username == 'env-user'
-            assert config.password == 'env-pass'
-            assert config.timeout == 20
-            assert config.max_retries == 5
-            assert config.retry_delay == 10
+            assert {k: getattr(config, k) for k in expected} == expected
 
 
 class TestEnvLoading:
@@ -135,31 +145,44 @@ class TestEnvLoading:
         assert config.max_retries == 7
         assert config.retry_delay == 2
 
-    @pytest.mark.parametrize(
-        "invalid_field,invalid_value,expected_error",
-        [
-            ('dsn', '', "DSN cannot be empty"),
-            ('username', '', "Username cannot be empty"),
-            ('password', '', "Password cannot be empty"),
-            ('timeout', 0, "Timeout must be a positive number"),
-            ('max_retries', -1, "Max retries cannot be negative"),
-            ('retry_delay', -1, "Retry delay cannot be negative"),
-        ]
-    )
-    def test_validate_invalid_config(self, invalid_field, invalid_value, expected_error):
+    def test_validate_invalid_config(self):
         """Test validation of invalid configurations"""
-        config_dict = TEST_CONFIG.copy()
-        config_dict[invalid_field] = invalid_value
-        with pytest.raises(ValidationError) as exc_info:
-            config = ISeriesConfig(**config_dict)
-            config.validate()
-        assert str(exc_info.value) == expected_error
+        # One test item instead of six parametrize cases; pytest's per-item
+        # setup dominates these two-line checks
+        for invalid_field, invalid_value, expected_error in INVALID_CONFIG_CASES:
+            with pytest.raises(ValidationError) as exc_info:
+                config = ISeriesConfig(**{**TEST_CONFIG, invalid_field: invalid_value})
+                config.validate()
+            assert str(exc_info.value) == expected_error, invalid_field
+
+@pytest.fixture(scope="module")
+def _shared_conn():
+    """Build the ISeriesConn once for the whole module"""
+    return ISeriesConn(**TEST_CONFIG)
+
+
+@pytest.fixture(scope="module")
+def _patch_read_sql():
+    """Install the pandas.read_sql patch once for the whole module"""
+    with patch('pandas.read_sql') as mocked:
+        yield mocked
+
+
+@pytest.fixture
+def mock_read_sql(_patch_read_sql):
+    """Per-test view of the shared read_sql mock, reset between tests"""
+    _patch_read_sql.reset_mock(return_value=True, side_effect=True)
+    return _patch_read_sql
+
 
 class TestISeriesConn:
     @pytest.fixture
-    def iseries_conn(self):
-        """Fixture to create an ISeriesConn instance"""
-        return ISeriesConn(**TEST_CONFIG)
+    def iseries_conn(self, _shared_conn):
+        """Per-test view of the shared instance, reset to pristine state after each test"""
+        yield _shared_conn
+        _shared_conn.conn = None
+        _shared_conn.echo = False
+        _shared_conn._fetch_cache.clear()
 
     def test_init(self, iseries_conn):
         """Test initialization of ISeriesConn"""
@@ -188,6 +211,24 @@ class TestISeriesConn:
         assert conn == mock_connection
         assert mock_connect.call_count == 2
 
+    @patch('iseries_connector.iseries_connector.time.sleep')
+    @patch('iseries_connector.iseries_connector.pyodbc.connect')
+    def test_connect_retry_backs_off_exponentially(self, mock_connect, mock_sleep, iseries_conn, mock_connection):
+        """Retry delays should roughly double between attempts, with jitter"""
+        mock_connect.side_effect = [
+            Exception("Connection failed"),
+            Exception("Connection failed"),
+            mock_connection
+        ]
+        conn = iseries_conn.connect()
+        assert conn == mock_connection
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 2
+        base = TEST_CONFIG['retry_delay']
+        assert base * 0.5 <= delays[0] <= base * 1.5
+        assert base <= delays[1] <= base * 3
+
     @patch('iseries_connector.iseries_connector.pyodbc.connect')
     def test_connect_failure(self, mock_connect, iseries_conn):
         """Test connection failure after all retries"""
@@ -211,33 +252,98 @@ class TestISeriesConn:
         assert iseries_conn.conn is None
         mock_connection.close.assert_called_once()
 
-    @patch('pandas.read_sql')
     @patch('iseries_connector.iseries_connector.pyodbc.connect')
-    def test_fetch_success(self, mock_connect, mock_read_sql, iseries_conn, mock_connection):
+    def test_fetch_success(self, mock_connect, iseries_conn, mock_connection, mock_read_sql):
         """Test successful query execution"""
         mock_connect.return_value = mock_connection
         expected_df = pd.DataFrame({'col1': [1, 2, 3]})
         mock_read_sql.return_value = expected_df
         
         result = iseries_conn.fetch("SELECT * FROM test_table")
-        assert result.equals(expected_df)
+        # fetch's contract is to hand back read_sql's frame untouched
+        assert result is expected_df
         mock_read_sql.assert_called_once()
         mock_connect.assert_called_once()
 
-    @patch('pandas.read_sql')
     @patch('iseries_connector.iseries_connector.pyodbc.connect')
-    def test_fetch_with_chunksize(self, mock_connect, mock_read_sql, iseries_conn, mock_connection):
-        """Test query execution with chunksize"""
+    def test_fetch_reuses_connection(self, mock_connect, iseries_conn, mock_connection, mock_read_sql):
+        """Repeated fetches should reuse the live connection instead of reconnecting"""
+        mock_connect.return_value = mock_connection
+        mock_read_sql.return_value = pd.DataFrame({'col1': [1]})
+
+        iseries_conn.fetch("SELECT * FROM test_table")
+        iseries_conn.fetch("SELECT * FROM test_table")
+
+        assert mock_connect.call_count == 1
+        assert mock_read_sql.call_count == 2
+
+    @patch('iseries_connector.iseries_connector.pyodbc.connect')
+    def test_fetch_cached_hits_skip_read_sql(self, mock_connect, iseries_conn, mock_connection, mock_read_sql):
+        """A repeated fetch(cache=True) should be served from the result cache"""
+        mock_connect.return_value = mock_connection
+        expected_df = pd.DataFrame({'col1': [1, 2, 3]})
+        mock_read_sql.return_value = expected_df
+
+        first = iseries_conn.fetch("SELECT * FROM test_table", cache=True)
+        second = iseries_conn.fetch("SELECT * FROM test_table", cache=True)
+
+        assert mock_read_sql.call_count == 1
+        assert second.equals(expected_df)
+        assert second is not first  # hits return a defensive copy
+
+    @patch('iseries_connector.iseries_connector.pyodbc.connect')
+    def test_fetch_cache_distinguishes_dtype_backend(self, mock_connect, iseries_conn, mock_connection, mock_read_sql):
+        """A cached query must not be served for a different dtype backend"""
         mock_connect.return_value = mock_connection
-        expected_dfs = [
+        mock_read_sql.return_value = pd.DataFrame({'col1': [1]})
+
+        iseries_conn.fetch("SELECT * FROM test_table", cache=True)
+        iseries_conn.fetch(
+            "SELECT * FROM test_table", cache=True, dtype_backend='pyarrow'
+        )
+
+        # The backend mismatch is a cache miss, so read_sql runs again
+        assert mock_read_sql.call_count == 2
+
+    def test_fetch_to_arrow_file(self, iseries_conn, tmp_path):
+        """Chunked results should stream into a readable Arrow IPC file"""
+        pa = pytest.importorskip("pyarrow")
+        out_path = str(tmp_path / "result.arrow")
+        chunks = [
             pd.DataFrame({'col1': [1, 2]}),
             pd.DataFrame({'col1': [3, 4]})
         ]
-        mock_read_sql.return_value = expected_dfs
-        
+
+        with patch.object(iseries_conn, 'fetch', return_value=iter(chunks)):
+            total = iseries_conn.fetch_to_arrow_file(
+                "SELECT * FROM test_table", out_path
+            )
+
+        assert total == 4
+        with pa.ipc.open_stream(pa.OSFile(out_path)) as reader:
+            table = reader.read_all()
+        assert table.num_rows == 4
+        assert table.column('col1').to_pylist() == [1, 2, 3, 4]
+
+    @patch('iseries_connector.iseries_connector.pyodbc.connect')
+    def test_fetch_with_chunksize(self, mock_connect, iseries_conn, mock_connection, mock_cursor):
+        """Test query execution with chunksize"""
+        mock_connect.return_value = mock_connection
+        mock_connection.cursor.return_value = mock_cursor
+        mock_cursor.description = [('col1',)]
+        mock_cursor.fetchmany.side_effect = [
+            [(1,), (2,)],
+            [(3,), (4,)],
+            []
+        ]
+
         result = iseries_conn.fetch("SELECT * FROM test_table", chunksize=2)
-        assert list(result) == expected_dfs
-        mock_read_sql.assert_called_once()
+        chunks = list(result)
+        assert len(chunks) == 2
+        assert chunks[0].equals(pd.DataFrame({'col1': [1, 2]}))
+        assert chunks[1].equals(pd.DataFrame({'col1': [3, 4]}))
+        mock_cursor.execute.assert_called_once_with("SELECT * FROM test_table")
+        mock_cursor.close.assert_called_once()
         mock_connect.assert_called_once()
 
     @patch('iseries_connector.iseries_connector.pyodbc.connect')
@@ -248,8 +354,7 @@ class TestISeriesConn:
             iseries_conn.fetch("SELECT * FROM test_table")
         assert "Failed to connect after" in str(exc_info.value)
 
-    @patch('pandas.read_sql')
-    def test_fetch_error(self, mock_read_sql, iseries_conn, mock_connection):
+    def test_fetch_error(self, iseries_conn, mock_connection, mock_read_sql):
         """Test query execution with error"""
         mock_read_sql.side_effect = Exception("Query failed")
         iseries_conn.conn = mock_connection
@@ -276,10 +381,32 @@ class TestISeriesConn:
         # Ensure semicolons are stripped before execution
         executed_statements = [call.args[0] for call in mock_cursor.execute.call_args_list]
         assert all(";" not in s for s in executed_statements)
-        mock_cursor.__enter__.assert_called()
-        mock_cursor.__exit__.assert_called()
+        # One statement handle is allocated for the whole batch
+        assert mock_cursor.__enter__.call_count == 1
+        assert mock_cursor.__exit__.call_count == 1
         mock_connect.assert_called_once()
 
+    @patch('iseries_connector.iseries_connector.pyodbc.connect')
+    def test_execute_statements_coalesced(self, mock_connect, iseries_conn, mock_connection, mock_cursor):
+        """Coalesced execution submits one compound block for the whole batch"""
+        mock_connect.return_value = mock_connection
+        mock_connection.cursor.return_value = mock_cursor
+
+        statements = [
+            "UPDATE table1 SET col1 = 'value1';",
+            "UPDATE table2 SET col2 = 'value2';"
+        ]
+
+        results = iseries_conn.execute_statements(statements, coalesce=True)
+        assert len(results) == 2
+        assert all(r['success'] for r in results)
+        assert mock_cursor.execute.call_count == 1
+        block = mock_cursor.execute.call_args.args[0]
+        assert block.startswith("BEGIN")
+        assert block.endswith("END")
+        assert "UPDATE table1 SET col1 = 'value1'" in block
+        assert "UPDATE table2 SET col2 = 'value2'" in block
+
     def test_execute_statements_parallel(self, iseries_conn):
         """Test parallel statement execution"""
         with patch.object(iseries_conn, '_execute_single_statement') as mock_execute:
@@ -464,7 +591,8 @@ class TestISeriesConn:
         with patch.object(iseries_conn, "fetch", return_value=expected_df) as mock_fetch:
             result = iseries_conn.fetch_from_file(str(sql_file))
 
-        assert result.equals(expected_df)
+        # fetch_from_file passes fetch's result straight through
+        assert result is expected_df
         mock_fetch.assert_called_once_with("SELECT * FROM test_table")
 
     def test_fetch_from_file_multiple_statements_error(self, iseries_conn, tmp_path):
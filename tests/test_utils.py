@@ -0,0 +1,140 @@
+"""Tests for logging utilities."""
+
+import contextvars
+import io
+import logging
+
+from iseries_connector.utils import (
+    RequestIdFilter,
+    _fast_request_id,
+    get_request_id,
+    request_scope,
+    set_request_id,
+    setup_logging,
+)
+
+
+class TestFastRequestId:
+    def test_returns_hex_string(self):
+        """Request IDs should be 32-character hex strings"""
+        request_id = _fast_request_id()
+        assert len(request_id) == 32
+        int(request_id, 16)
+
+    def test_ids_are_unique(self):
+        """Consecutive IDs should not repeat, including across pool refills"""
+        ids = {_fast_request_id() for _ in range(1000)}
+        assert len(ids) == 1000
+
+
+class TestRequestIdFilter:
+    def _make_record(self):
+        return logging.LogRecord(
+            name="test", level=logging.INFO, pathname=__file__,
+            lineno=1, msg="message", args=(), exc_info=None
+        )
+
+    def test_stamps_missing_request_id(self):
+        """Records without a request_id should get one"""
+        record = self._make_record()
+        assert RequestIdFilter().filter(record) is True
+        assert record.request_id
+
+    def test_counter_ids_are_unique(self):
+        """Counter-based IDs should not repeat across contexts"""
+        ids = set()
+        log_filter = RequestIdFilter()
+        for _ in range(100):
+            with request_scope():
+                record = self._make_record()
+                log_filter.filter(record)
+                ids.add(record.request_id)
+        assert len(ids) == 100
+
+    def test_secure_ids_use_random_hex(self):
+        """secure_ids=True should fall back to 128-bit random hex IDs"""
+        record = self._make_record()
+        # run in an empty context so the filter must generate a fresh ID
+        contextvars.Context().run(RequestIdFilter(secure_ids=True).filter, record)
+        assert len(record.request_id) == 32
+        int(record.request_id, 16)
+
+    def test_preserves_existing_request_id(self):
+        """Records that already carry a request_id should be left untouched"""
+        record = self._make_record()
+        record.request_id = "preset-id"
+        RequestIdFilter().filter(record)
+        assert record.request_id == "preset-id"
+
+
+class TestRequestScope:
+    def _make_record(self):
+        return logging.LogRecord(
+            name="test", level=logging.INFO, pathname=__file__,
+            lineno=1, msg="message", args=(), exc_info=None
+        )
+
+    def test_records_share_id_within_scope(self):
+        """All records inside one request_scope should carry the same ID"""
+        log_filter = RequestIdFilter()
+        with request_scope() as rid:
+            first = self._make_record()
+            second = self._make_record()
+            log_filter.filter(first)
+            log_filter.filter(second)
+        assert first.request_id == rid
+        assert second.request_id == rid
+
+    def test_scope_restores_previous_id(self):
+        """Leaving a request_scope should restore the outer context's ID"""
+        outer = set_request_id()
+        with request_scope() as inner:
+            assert get_request_id() == inner
+            assert inner != outer
+        assert get_request_id() == outer
+
+    def test_explicit_id_is_used(self):
+        """A caller-supplied ID should be used verbatim"""
+        with request_scope("my-request") as rid:
+            assert rid == "my-request"
+            assert get_request_id() == "my-request"
+
+
+class TestSetupLogging:
+    def _request_id_filters(self, logger):
+        return [
+            f for handler in logger.handlers for f in handler.filters
+            if isinstance(f, RequestIdFilter)
+        ]
+
+    def test_returns_logger_with_filter(self):
+        """setup_logging should attach a RequestIdFilter to the handler"""
+        logger = setup_logging("test_setup_logging")
+        assert self._request_id_filters(logger)
+
+    def test_repeated_setup_does_not_stack_filters(self):
+        """Calling setup_logging twice should not add duplicate filters"""
+        logger = setup_logging("test_setup_logging_repeat")
+        setup_logging("test_setup_logging_repeat")
+        assert len(self._request_id_filters(logger)) == 1
+
+    def test_no_filter_for_plain_format(self):
+        """A format without request_id should not get the filter"""
+        logger = setup_logging(
+            "test_setup_logging_plain",
+            fmt='%(asctime)s - %(levelname)s - %(message)s'
+        )
+        assert not self._request_id_filters(logger)
+
+    def test_child_logger_records_are_stamped(self):
+        """Records propagated from child loggers should format with a request_id"""
+        logger = setup_logging("test_setup_logging_child")
+        stream = io.StringIO()
+        logger.handlers[0].setStream(stream)
+
+        with request_scope("child-rid"):
+            logging.getLogger("test_setup_logging_child.sub").info("hello")
+
+        output = stream.getvalue()
+        assert "hello" in output
+        assert "[child-rid]" in output